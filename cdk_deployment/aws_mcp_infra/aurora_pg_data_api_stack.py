@@ -8,7 +8,8 @@ from aws_cdk import (  # type: ignore
     RemovalPolicy
 )
 from constructs import Construct  # type: ignore
-import os
+from .docker_assets import SERVER_CPU_ARCHITECTURE, SERVER_PLATFORM, docker_cache_options, python_server_build_options
+from .task_logging import server_log_driver
 import json # Required if creating secret template
 
 class AuroraPgDataApiStack(Stack):
@@ -27,13 +28,11 @@ class AuroraPgDataApiStack(Stack):
         db_secret = secretsmanager.Secret.from_secret_complete_arn(self, "ImportedRdsDbSecret", db_secret_arn)
 
         # --- ECR Asset (Build Docker Image) ---
-        docker_build_path = os.path.join(os.path.dirname(__file__), "..", "..", "mcp_servers", "aurora_pg_data_api")
-
-        if not os.path.exists(os.path.join(docker_build_path, "Dockerfile")):
-             raise FileNotFoundError(f"Dockerfile not found in: {docker_build_path}")
-
+        # Built from the mcp_servers/ context so the image shares its base dependency layer with the other Python servers
         docker_asset = ecr_assets.DockerImageAsset(self, "AuroraPgDataApiImageAsset",
-            directory=docker_build_path
+            platform=SERVER_PLATFORM,
+            **python_server_build_options("aurora_pg_data_api"),
+            **docker_cache_options(self, "aurora-pg-data-api-cache")
         )
 
         # --- IAM Role for ECS Task ---
@@ -60,15 +59,13 @@ class AuroraPgDataApiStack(Stack):
             task_role=task_role,
             runtime_platform=ecs.RuntimePlatform(
                 operating_system_family=ecs.OperatingSystemFamily.LINUX,
-                cpu_architecture=ecs.CpuArchitecture.X86_64
+                cpu_architecture=SERVER_CPU_ARCHITECTURE
             )
         )
 
         container = fargate_task_definition.add_container("AuroraPgDataApiContainer",
             image=ecs.ContainerImage.from_docker_image_asset(docker_asset),
-            logging=ecs.LogDrivers.aws_logs(
-                stream_prefix="AuroraPgDataApiMcp"
-            ),
+            logging=server_log_driver("AuroraPgDataApiMcp"),
             # Pass cluster ARN, secret ARN, and default DB name to the container
             environment={
                 "DB_CLUSTER_ARN": db_cluster_arn,
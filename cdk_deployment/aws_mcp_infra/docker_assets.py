@@ -0,0 +1,59 @@
+from aws_cdk import (  # type: ignore
+    IgnoreMode,
+    aws_ecr_assets as ecr_assets,
+    aws_ecs as ecs,
+)
+from constructs import Construct  # type: ignore
+import os
+from typing import Any, Dict
+
+# Root of the MCP server sources; the Python servers use it as their Docker build context
+MCP_SERVERS_DIR = os.path.join(os.path.dirname(__file__), "..", "..", "mcp_servers")
+
+# Image platform and task CPU architecture of every server; defined together so they can't disagree.
+# Graviton (ARM64) Fargate tasks cost less than x86_64 ones for the same vCPU/memory.
+SERVER_PLATFORM = ecr_assets.Platform.LINUX_ARM64
+SERVER_CPU_ARCHITECTURE = ecs.CpuArchitecture.ARM64
+
+# Context key holding the ECR repository URI used as a BuildKit layer cache,
+# e.g. `cdk deploy -c docker_cache_repository=123456789012.dkr.ecr.us-west-2.amazonaws.com/mcp-build-cache`
+DOCKER_CACHE_REPOSITORY_CONTEXT_KEY = "docker_cache_repository"
+
+
+def docker_cache_options(scope: Construct, cache_tag: str) -> Dict[str, Any]:
+    """ Returns cache_from/cache_to kwargs for a DockerImageAsset, or {} if no cache repository is configured """
+    cache_repository = scope.node.try_get_context(DOCKER_CACHE_REPOSITORY_CONTEXT_KEY)
+    if not cache_repository:
+        return {} # Local builds without a cache repository behave as before
+
+    # Each image gets its own tag in the cache repository. CDK pushes every asset
+    # to a single shared ECR repo, so its image tags cannot serve as a cache source.
+    cache_ref = f"{cache_repository}:{cache_tag}"
+    return {
+        "cache_from": [ecr_assets.DockerCacheOption(type="registry", params={"ref": cache_ref})],
+        "cache_to": ecr_assets.DockerCacheOption(
+            type="registry",
+            params={
+                "ref": cache_ref,
+                "mode": "max", # Export intermediate layers too (e.g. pip/npm install)
+                "image-manifest": "true", # Required for ECR to accept the cache manifest
+                "oci-mediatypes": "true"
+            }
+        ),
+    }
+
+
+def python_server_build_options(server_dir: str) -> Dict[str, Any]:
+    """ Returns DockerImageAsset kwargs that build mcp_servers/<server_dir>/Dockerfile with the shared base requirements """
+    dockerfile = os.path.join(MCP_SERVERS_DIR, server_dir, "Dockerfile")
+    if not os.path.exists(dockerfile):
+        raise FileNotFoundError(f"Dockerfile not found in: {os.path.dirname(dockerfile)}")
+
+    return {
+        "directory": MCP_SERVERS_DIR,
+        "file": f"{server_dir}/Dockerfile", # Relative to the build context
+        # Only send the shared base files and this server's sources, so changes to
+        # another server do not change this image's asset hash
+        "exclude": ["*", "!base", f"!{server_dir}"],
+        "ignore_mode": IgnoreMode.DOCKER,
+    }
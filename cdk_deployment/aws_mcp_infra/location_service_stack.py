@@ -7,6 +7,8 @@ from aws_cdk import (  # type: ignore
     RemovalPolicy
 )
 from constructs import Construct  # type: ignore
+from .docker_assets import SERVER_CPU_ARCHITECTURE, SERVER_PLATFORM, docker_cache_options
+from .task_logging import server_log_driver
 import os
 
 class LocationServiceStack(Stack):
@@ -36,8 +38,9 @@ class LocationServiceStack(Stack):
              raise FileNotFoundError(f"Dockerfile not found in: {docker_build_path}")
 
         docker_asset = ecr_assets.DockerImageAsset(self, "LocationServiceImageAsset",
-            directory=docker_build_path
-            # platform=ecr_assets.Platform.LINUX_AMD64 # Specify platform if needed
+            directory=docker_build_path,
+            platform=SERVER_PLATFORM,
+            **docker_cache_options(self, "location-service-cache")
         )
 
         # --- IAM Role for ECS Task ---
@@ -69,16 +72,14 @@ class LocationServiceStack(Stack):
             task_role=task_role,
             runtime_platform=ecs.RuntimePlatform(
                 operating_system_family=ecs.OperatingSystemFamily.LINUX,
-                cpu_architecture=ecs.CpuArchitecture.X86_64 # Or ARM64 if base image supports it
+                cpu_architecture=SERVER_CPU_ARCHITECTURE
             )
         )
 
         # Add container to the task definition
         container = fargate_task_definition.add_container("LocationServiceContainer",
             image=ecs.ContainerImage.from_docker_image_asset(docker_asset),
-            logging=ecs.LogDrivers.aws_logs(
-                stream_prefix="LocationServiceMcp"
-            ),
+            logging=server_log_driver("LocationServiceMcp"),
             # Pass the desired AWS region to the container
             environment={
                 "AWS_REGION": "us-west-2"
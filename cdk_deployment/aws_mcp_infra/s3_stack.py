@@ -7,7 +7,8 @@ from aws_cdk import (  # type: ignore
     RemovalPolicy
 )
 from constructs import Construct  # type: ignore
-import os
+from .docker_assets import SERVER_CPU_ARCHITECTURE, SERVER_PLATFORM, docker_cache_options, python_server_build_options
+from .task_logging import server_log_driver
 
 class S3Stack(Stack):
 
@@ -16,14 +17,11 @@ class S3Stack(Stack):
         super().__init__(scope, construct_id, **kwargs)
 
         # --- ECR Asset (Build Docker Image) ---
-        docker_build_path = os.path.join(os.path.dirname(__file__), "..", "..", "mcp_servers", "s3")
-
-        # Basic sanity check for Dockerfile existence
-        if not os.path.exists(os.path.join(docker_build_path, "Dockerfile")):
-             raise FileNotFoundError(f"Dockerfile not found in: {docker_build_path}")
-
+        # Built from the mcp_servers/ context so the image shares its base dependency layer with the other Python servers
         docker_asset = ecr_assets.DockerImageAsset(self, "S3ServiceImageAsset",
-            directory=docker_build_path
+            platform=SERVER_PLATFORM,
+            **python_server_build_options("s3"),
+            **docker_cache_options(self, "s3-cache")
         )
 
         # --- IAM Role for ECS Task ---
@@ -38,6 +36,7 @@ class S3Stack(Stack):
                 "s3:ListBucket",       # For list_objects tool
                 "s3:GetObject",        # For get_object tool
                 "s3:PutObject",        # For put_object tool
+                "s3:AbortMultipartUpload", # For put_object tool (cleanup of failed multipart uploads)
                 "s3:DeleteObject"      # For delete_object tool
                 # Add other S3 permissions if more tools are added
             ],
@@ -53,15 +52,13 @@ class S3Stack(Stack):
             task_role=task_role,
             runtime_platform=ecs.RuntimePlatform(
                 operating_system_family=ecs.OperatingSystemFamily.LINUX,
-                cpu_architecture=ecs.CpuArchitecture.X86_64 # Match base image in Dockerfile
+                cpu_architecture=SERVER_CPU_ARCHITECTURE
             )
         )
 
         container = fargate_task_definition.add_container("S3ServiceContainer",
             image=ecs.ContainerImage.from_docker_image_asset(docker_asset),
-            logging=ecs.LogDrivers.aws_logs(
-                stream_prefix="S3ServiceMcp"
-            )
+            logging=server_log_driver("S3ServiceMcp")
             # Add environment variables if needed
         )
 
@@ -0,0 +1,20 @@
+from aws_cdk import (  # type: ignore
+    Size,
+    aws_ecs as ecs,
+    aws_logs as logs,
+)
+
+# Shared by every server so retention and buffering can't drift apart between services
+LOG_RETENTION = logs.RetentionDays.ONE_MONTH
+LOG_BUFFER_SIZE = Size.mebibytes(25)
+
+
+def server_log_driver(stream_prefix: str) -> ecs.LogDriver:
+    """ Returns the CloudWatch Logs driver used by the MCP server containers """
+    return ecs.LogDrivers.aws_logs(
+        stream_prefix=stream_prefix,
+        log_retention=LOG_RETENTION,
+        # Buffer log events instead of blocking the server's stdout/stderr writes
+        mode=ecs.AwsLogDriverMode.NON_BLOCKING,
+        max_buffer_size=LOG_BUFFER_SIZE
+    )
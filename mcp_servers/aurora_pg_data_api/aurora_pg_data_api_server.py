@@ -5,9 +5,10 @@ import json
 import logging
 import os
 import sys
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import boto3  # type: ignore
+from botocore.config import Config  # type: ignore
 from botocore.exceptions import ClientError  # type: ignore
 
 # Assuming FastMCP is installed and provides these components
@@ -18,7 +19,15 @@ logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(
 logger = logging.getLogger(__name__)
 
 # --- Boto3 Client for RDS Data API ---
-rds_data_client = boto3.client('rds-data')
+# A single client is shared by all tool calls; the default pool of 10 connections
+# is too small for concurrent requests, and keepalive avoids TLS re-handshakes on idle sockets
+RDS_DATA_CLIENT_CONFIG = Config(
+    max_pool_connections=64,
+    retries={'mode': 'adaptive', 'max_attempts': 5},
+    tcp_keepalive=True
+)
+# Created in main() so importing this module stays free of side effects
+rds_data_client: Any = None
 
 # --- Configuration from Environment Variables ---
 # These will be provided by the CDK stack
@@ -26,39 +35,47 @@ CLUSTER_ARN = os.environ.get("DB_CLUSTER_ARN")
 SECRET_ARN = os.environ.get("DB_SECRET_ARN")
 DEFAULT_DATABASE_NAME = os.environ.get("DEFAULT_DB_NAME", "postgres") # Default DB, often 'postgres' for PG
 
-if not CLUSTER_ARN or not SECRET_ARN:
-    logger.error("Missing required environment variables: DB_CLUSTER_ARN and DB_SECRET_ARN")
-    sys.exit(1)
-
 # --- Tool Handlers ---
 
+# Extract a value from a Data API field based on its (single) type hint key
+_EXTRACTORS = {
+    'stringValue': lambda v: v,
+    'longValue': lambda v: v,
+    'doubleValue': lambda v: v,
+    'booleanValue': lambda v: v,
+    'blobValue': lambda v: f"BLOB (length: {len(v)})", # Represent blob as string placeholder
+    'isNull': lambda v: None,
+}
+
+def _extract(field: Dict[str, Any]) -> Any:
+    type_key, value = next(iter(field.items()))
+    extractor = _EXTRACTORS.get(type_key)
+    if extractor is None:
+        # Handle other types like arrayValue if needed
+        return f"Unsupported type: {type_key}"
+    return extractor(value)
+
 def format_records(records: List[List[Dict[str, Any]]], column_metadata: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """ Formats RDS Data API results into a list of dictionaries """
-    formatted_results = []
-    column_names = [meta['label'] for meta in column_metadata] # Use label as column name
-
-    for record in records:
-        row = {}
-        for i, field in enumerate(record):
-            key = column_names[i]
-            # Extract value based on type hint from Data API
-            if 'stringValue' in field:
-                row[key] = field['stringValue']
-            elif 'longValue' in field:
-                row[key] = field['longValue']
-            elif 'doubleValue' in field:
-                row[key] = field['doubleValue']
-            elif 'booleanValue' in field:
-                row[key] = field['booleanValue']
-            elif 'blobValue' in field:
-                row[key] = f"BLOB (length: {len(field['blobValue'])})" # Represent blob as string placeholder
-            elif 'isNull' in field and field['isNull']:
-                row[key] = None
-            else:
-                 # Handle other types like arrayValue if needed
-                 row[key] = f"Unsupported type: {list(field.keys())[0]}"
-        formatted_results.append(row)
-    return formatted_results
+    column_names = tuple(meta['label'] for meta in column_metadata) # Use label as column name
+    return [{name: _extract(field) for name, field in zip(column_names, record)} for record in records]
+
+# Map common RDS Data API error codes to MCP errors and message labels
+_RDSDATA_ERROR_MAP: Dict[str, Tuple[ErrorCode, str]] = {
+    'BadRequestException': (ErrorCode.InvalidRequest, "Bad Request"), # Could be syntax error, invalid params, etc.
+    'StatementTimeoutException': (ErrorCode.Timeout, "Statement Timeout"),
+    'ForbiddenException': (ErrorCode.PermissionDenied, "Forbidden"),
+    'NotFoundException': (ErrorCode.NotFound, "Not Found (e.g., DB)"),
+    'ServiceUnavailableError': (ErrorCode.Unavailable, "Service Unavailable"),
+}
+
+def _to_mcp_error(e: ClientError) -> McpError:
+    """ Logs an RDS Data API ClientError and converts it to the matching McpError """
+    error_code = e.response.get('Error', {}).get('Code')
+    error_message = e.response.get('Error', {}).get('Message', str(e))
+    logger.error("RDS Data API Error (%s): %s", error_code, error_message)
+    mcp_code, label = _RDSDATA_ERROR_MAP.get(error_code, (ErrorCode.InternalError, "Error"))
+    return McpError(mcp_code, f"RDS Data API {label}: {error_message}")
 
 async def execute_sql_handler(args: Dict[str, Any]) -> Dict[str, Any]:
     """Executes a SQL statement using the RDS Data API."""
@@ -66,6 +83,7 @@ async def execute_sql_handler(args: Dict[str, Any]) -> Dict[str, Any]:
     database = args.get('database_name', DEFAULT_DATABASE_NAME) # Use default DB if not specified
     include_result_metadata = args.get('include_result_metadata', False)
     continue_after_timeout = args.get('continue_after_timeout', False)
+    raw = args.get('raw', False) # Return Data API records/metadata unchanged, skipping format_records
     # Parameters for prepared statements (optional)
     parameters = args.get('parameters') # Expects a list of {'name': 'param_name', 'value': {'stringValue': 'val', ...}}
 
@@ -73,19 +91,20 @@ async def execute_sql_handler(args: Dict[str, Any]) -> Dict[str, Any]:
         raise McpError(ErrorCode.InvalidParams, "Missing required parameter: sql_statement")
 
     try:
-        logger.info(f"Executing SQL via Data API on DB '{database}': {sql[:100]}...")
+        logger.info("Executing SQL via Data API on DB '%s': %.100s...", database, sql)
         params_to_pass = {
             'resourceArn': CLUSTER_ARN,
             'secretArn': SECRET_ARN,
             'database': database,
             'sql': sql,
-            'includeResultMetadata': include_result_metadata,
+            'includeResultMetadata': include_result_metadata or raw, # raw results always carry the column metadata
             'continueAfterTimeout': continue_after_timeout,
         }
         if parameters:
             params_to_pass['parameters'] = parameters
 
-        response = rds_data_client.execute_statement(**params_to_pass)
+        # boto3 is blocking; run it in a worker thread so the event loop keeps serving other MCP messages
+        response = await asyncio.to_thread(rds_data_client.execute_statement, **params_to_pass)
 
         result = {
             "status": "success",
@@ -93,7 +112,11 @@ async def execute_sql_handler(args: Dict[str, Any]) -> Dict[str, Any]:
             "generated_fields": response.get('generatedFields', []), # For INSERT with RETURNING
         }
         if 'records' in response:
-            if include_result_metadata and 'columnMetadata' in response:
+            if raw:
+                 result['records'] = response['records']
+                 if 'columnMetadata' in response:
+                      result['column_metadata'] = response['columnMetadata']
+            elif include_result_metadata and 'columnMetadata' in response:
                  result['column_metadata'] = response['columnMetadata']
                  result['records'] = format_records(response['records'], response['columnMetadata'])
             else:
@@ -103,27 +126,113 @@ async def execute_sql_handler(args: Dict[str, Any]) -> Dict[str, Any]:
         return result
 
     except ClientError as e:
-        error_code = e.response.get('Error', {}).get('Code')
-        error_message = e.response.get('Error', {}).get('Message', str(e))
-        logger.error(f"RDS Data API Error ({error_code}): {error_message}")
-        # Map common RDS Data API errors to MCP errors
-        if error_code == 'BadRequestException':
-            # Could be syntax error, invalid params, etc.
-             raise McpError(ErrorCode.InvalidRequest, f"RDS Data API Bad Request: {error_message}")
-        elif error_code == 'StatementTimeoutException':
-             raise McpError(ErrorCode.Timeout, f"RDS Data API Statement Timeout: {error_message}")
-        elif error_code == 'ForbiddenException':
-             raise McpError(ErrorCode.PermissionDenied, f"RDS Data API Forbidden: {error_message}")
-        elif error_code == 'NotFoundException':
-             raise McpError(ErrorCode.NotFound, f"RDS Data API Not Found (e.g., DB): {error_message}")
-        elif error_code == 'ServiceUnavailableError':
-             raise McpError(ErrorCode.Unavailable, f"RDS Data API Service Unavailable: {error_message}")
-        else:
-             raise McpError(ErrorCode.InternalError, f"RDS Data API Error: {error_message}")
+        raise _to_mcp_error(e)
     except Exception as e:
-        logger.exception(f"Unexpected error during SQL execution: {e}")
+        logger.exception("Unexpected error during SQL execution: %s", e)
         raise McpError(ErrorCode.InternalError, f"Unexpected server error: {e}")
 
+async def batch_execute_sql_handler(args: Dict[str, Any]) -> Dict[str, Any]:
+    """Executes a SQL statement once per parameter set in a single RDS Data API call."""
+    sql = args.get('sql_statement')
+    database = args.get('database_name', DEFAULT_DATABASE_NAME) # Use default DB if not specified
+    parameter_sets = args.get('parameter_sets') # Expects a list of parameter lists, one per execution
+
+    if not sql or not parameter_sets:
+        raise McpError(ErrorCode.InvalidParams, "Missing required parameters: sql_statement, parameter_sets")
+    if not isinstance(parameter_sets, list) or not all(isinstance(s, list) for s in parameter_sets):
+        raise McpError(ErrorCode.InvalidParams, "parameter_sets must be a list of parameter lists")
+
+    try:
+        logger.info("Executing batch SQL via Data API on DB '%s' with %d parameter sets: %.100s...", database, len(parameter_sets), sql)
+        response = await asyncio.to_thread(
+            rds_data_client.batch_execute_statement,
+            resourceArn=CLUSTER_ARN,
+            secretArn=SECRET_ARN,
+            database=database,
+            sql=sql,
+            parameterSets=parameter_sets
+        )
+        return {
+            "status": "success",
+            "update_results": response.get('updateResults', []), # generatedFields per parameter set
+        }
+
+    except ClientError as e:
+        raise _to_mcp_error(e)
+    except Exception as e:
+        logger.exception("Unexpected error during batch SQL execution: %s", e)
+        raise McpError(ErrorCode.InternalError, f"Unexpected server error: {e}")
+
+
+# --- Tool Definitions ---
+# Built once at import so every server instance reuses the same schema objects
+
+_EXECUTE_SQL_TOOL = Tool(
+    name="execute_sql",
+    description="Executes a SQL statement against the configured Aurora PostgreSQL cluster using the RDS Data API.",
+    input_schema=ToolInputSchema(
+        required=["sql_statement"],
+        properties={
+            "sql_statement": ToolParameter(type="string", description="The SQL statement to execute."),
+            "database_name": ToolParameter(type="string", description=f"Optional name of the database to target (default: {DEFAULT_DATABASE_NAME})."),
+            "include_result_metadata": ToolParameter(type="boolean", description="Optional. Include column metadata in the response (default: false)."),
+            "continue_after_timeout": ToolParameter(type="boolean", description="Optional. Continue running query after timeout (default: false)."),
+            "raw": ToolParameter(type="boolean", description="Optional. Return records and column metadata in the raw RDS Data API format without converting rows to objects (default: false)."),
+            "parameters": ToolParameter(
+                type="array",
+                description="Optional. Parameters for the SQL statement (use :param_name syntax in SQL).",
+                items={
+                    "type": "object",
+                    "properties": {
+                        "name": {"type": "string"},
+                        "value": {
+                            "type": "object",
+                            "description": "Value with type hint, e.g., {'stringValue': 'value'}, {'longValue': 123}, {'isNull': true}"
+                        }
+                    },
+                    "required": ["name", "value"]
+                }
+            )
+        }
+    ),
+    handler=execute_sql_handler
+)
+
+_BATCH_EXECUTE_SQL_TOOL = Tool(
+    name="batch_execute_sql",
+    description="Executes a SQL statement once for each parameter set in a single RDS Data API call (e.g., bulk INSERT/UPDATE).",
+    input_schema=ToolInputSchema(
+        required=["sql_statement", "parameter_sets"],
+        properties={
+            "sql_statement": ToolParameter(type="string", description="The SQL statement to execute (use :param_name syntax in SQL)."),
+            "database_name": ToolParameter(type="string", description=f"Optional name of the database to target (default: {DEFAULT_DATABASE_NAME})."),
+            "parameter_sets": ToolParameter(
+                type="array",
+                description="Parameter sets; the statement is executed once per set.",
+                items={
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "name": {"type": "string"},
+                            "value": {
+                                "type": "object",
+                                "description": "Value with type hint, e.g., {'stringValue': 'value'}, {'longValue': 123}, {'isNull': true}"
+                            }
+                        },
+                        "required": ["name", "value"]
+                    }
+                }
+            )
+        }
+    ),
+    handler=batch_execute_sql_handler
+)
+
+# Add helper tools if desired, e.g., list_databases (executes specific SQL)
+# Tool(name="list_databases", description="Lists databases using SQL.", input_schema=..., handler=...)
+_TOOLS: List[Tool] = [_EXECUTE_SQL_TOOL, _BATCH_EXECUTE_SQL_TOOL]
+
 
 # --- MCP Server Setup ---
 
@@ -141,53 +250,27 @@ class AuroraPgDataApiMcpServer:
         self.server.onerror = self._handle_error
 
     def _handle_error(self, error: Exception):
-        logger.error(f"MCP Server Error: {error}")
+        logger.error("MCP Server Error: %s", error)
 
     def _get_tools(self) -> List[Tool]:
-        return [
-            Tool(
-                name="execute_sql",
-                description="Executes a SQL statement against the configured Aurora PostgreSQL cluster using the RDS Data API.",
-                input_schema=ToolInputSchema(
-                    required=["sql_statement"],
-                    properties={
-                        "sql_statement": ToolParameter(type="string", description="The SQL statement to execute."),
-                        "database_name": ToolParameter(type="string", description=f"Optional name of the database to target (default: {DEFAULT_DATABASE_NAME})."),
-                        "include_result_metadata": ToolParameter(type="boolean", description="Optional. Include column metadata in the response (default: false)."),
-                        "continue_after_timeout": ToolParameter(type="boolean", description="Optional. Continue running query after timeout (default: false)."),
-                        "parameters": ToolParameter(
-                            type="array",
-                            description="Optional. Parameters for the SQL statement (use :param_name syntax in SQL).",
-                            items={
-                                "type": "object",
-                                "properties": {
-                                    "name": {"type": "string"},
-                                    "value": {
-                                        "type": "object",
-                                        "description": "Value with type hint, e.g., {'stringValue': 'value'}, {'longValue': 123}, {'isNull': true}"
-                                    }
-                                },
-                                "required": ["name", "value"]
-                            }
-                        )
-                    }
-                ),
-                handler=execute_sql_handler
-            ),
-            # Add helper tools if desired, e.g., list_databases (executes specific SQL)
-            # Tool(name="list_databases", description="Lists databases using SQL.", input_schema=..., handler=...)
-        ]
+        return _TOOLS
 
     async def run(self):
         if not CLUSTER_ARN or not SECRET_ARN:
              logger.critical("Server cannot start: DB_CLUSTER_ARN and DB_SECRET_ARN must be set.")
              return # Prevent server from running without config
 
-        logger.info(f"Starting Aurora PG Data API MCP Server for cluster: {CLUSTER_ARN}")
+        logger.info("Starting Aurora PG Data API MCP Server for cluster: %s", CLUSTER_ARN)
         await self.server.run()
         logger.info("Aurora PG Data API MCP Server stopped.")
 
 async def main():
+    global rds_data_client
+    if not CLUSTER_ARN or not SECRET_ARN:
+        logger.error("Missing required environment variables: DB_CLUSTER_ARN and DB_SECRET_ARN")
+        sys.exit(1)
+
+    rds_data_client = boto3.client('rds-data', config=RDS_DATA_CLIENT_CONFIG)
     transport = StdioTransport()
     server_instance = AuroraPgDataApiMcpServer(transport)
     await server_instance.run()
@@ -1,14 +1,21 @@
 #!/usr/bin/env python3
 
 import asyncio
+import base64
+import codecs
+import functools
 import json
 import logging
+import operator
 import os
 import sys
-from typing import Any, Dict, List, Optional
+import time
+from typing import Any, Dict, List, Optional, Tuple
 
-import boto3  # type: ignore
-from botocore.exceptions import ClientError  # type: ignore
+from aiobotocore.config import AioConfig  # type: ignore
+from aiobotocore.session import get_session  # type: ignore
+from botocore.exceptions import BotoCoreError, ClientError  # type: ignore
+from cachetools import LRUCache  # type: ignore
 
 # Assuming FastMCP is installed and provides these components
 # Adjust imports based on the actual FastMCP library structure
@@ -18,110 +25,420 @@ from fastmcp import McpServer, McpTransport, StdioTransport, Tool, ToolParameter
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-# --- Boto3 S3 Client ---
+# --- aiobotocore S3 Client ---
 # Use environment variables for credentials when running in ECS/EKS via IAM Role
 # For local testing, ensure AWS credentials are configured (e.g., ~/.aws/credentials)
-s3_client = boto3.client('s3')
+# The client is non-blocking, so S3 round trips don't stall the event loop.
+# It is created in S3McpServer.run() because it must be entered as an async context manager.
+session = get_session()
+s3_client: Any = None
+# Built once per client in S3McpServer.run() rather than on every list_objects call
+list_objects_paginator: Any = None
+
+# Size the connection pool for concurrent tool calls (default is 10), keep idle sockets
+# alive to avoid repeated TLS handshakes, and retry throttling adaptively
+S3_CLIENT_CONFIG = AioConfig(
+    max_pool_connections=int(os.environ.get('S3_MAX_POOL', '64')),
+    tcp_keepalive=True,
+    retries={'max_attempts': 5, 'mode': 'adaptive'}
+)
+
+# Bounds concurrent tool calls (not S3 requests: list, upload and delete calls fan out internally)
+# to the pool size; created in S3McpServer.run() on the server's event loop
+s3_semaphore: Any = None
+
+def _limit_concurrency(handler):
+    """ Runs the wrapped tool handler while holding a slot of s3_semaphore """
+    @functools.wraps(handler)
+    async def wrapper(*args: Any) -> Dict[str, Any]:
+        async with s3_semaphore:
+            return await handler(*args)
+    return wrapper
+
+def _bind_args(required: Tuple[str, ...] = (), optional: Optional[Dict[str, Any]] = None, allow_empty: Tuple[str, ...] = ()):
+    """ Adapts a handler taking positional parameters to the MCP handler signature (a single args dict).
+    The handler receives the required parameters in order, then the optional ones (falling back to
+    their defaults when missing or None). Required parameters that are missing, None or '' (unless in allow_empty) are
+    rejected with InvalidParams. The lookup plan is computed once, when the handler is defined. """
+    optional_items = tuple((optional or {}).items())
+    rejected_if_empty = frozenset(required) - frozenset(allow_empty)
+
+    def decorator(handler):
+        # Not functools.wraps: it would set __wrapped__, making inspect.signature() report the
+        # handler's positional parameters instead of the (args) signature actually called
+        async def wrapper(args: Dict[str, Any]) -> Dict[str, Any]:
+            values = [args.get(name) for name in required]
+            missing = [
+                name for name, value in zip(required, values)
+                if value is None or (value == '' and name in rejected_if_empty)
+            ]
+            if missing:
+                raise McpError(ErrorCode.InvalidParams, f"Missing required parameters: {', '.join(missing)}")
+            for name, default in optional_items:
+                value = args.get(name)
+                values.append(default if value is None else value)
+            return await handler(*values)
+        wrapper.__name__ = handler.__name__
+        wrapper.__qualname__ = handler.__qualname__
+        wrapper.__doc__ = handler.__doc__
+        return wrapper
+    return decorator
+
+S3_API_ERROR_PREFIX = "AWS S3 API Error: "
+
+def _to_mcp_error(e: ClientError) -> McpError:
+    """ Converts an S3 ClientError to an McpError carrying the S3 error message """
+    return McpError(ErrorCode.InternalError, S3_API_ERROR_PREFIX + e.response['Error']['Message'])
 
 # --- Tool Definitions ---
 
-async def list_buckets_handler(args: Dict[str, Any]) -> Dict[str, Any]:
+# ListBuckets results rarely change while the server runs, so they are reused for a short TTL
+BUCKETS_CACHE_TTL = float(os.environ.get('S3_BUCKETS_CACHE_TTL', '30')) # Seconds
+buckets_cache: Dict[str, Any] = {'expires': 0.0, 'buckets': None}
+
+async def _list_bucket_names() -> List[str]:
+    """ Calls ListBuckets and refreshes buckets_cache """
+    response = await s3_client.list_buckets()
+    buckets = [bucket['Name'] for bucket in response.get('Buckets', [])]
+    buckets_cache['buckets'] = buckets
+    buckets_cache['expires'] = time.monotonic() + BUCKETS_CACHE_TTL
+    return buckets
+
+@_bind_args()
+@_limit_concurrency
+async def list_buckets_handler() -> Dict[str, Any]:
     """Lists all S3 buckets."""
+    if time.monotonic() < buckets_cache['expires']:
+        return {"buckets": list(buckets_cache['buckets'])}
     try:
-        response = s3_client.list_buckets()
-        buckets = [bucket['Name'] for bucket in response.get('Buckets', [])]
-        return {"buckets": buckets}
+        buckets = await _list_bucket_names()
+        return {"buckets": list(buckets)}
     except ClientError as e:
-        logger.error(f"Error listing buckets: {e}")
-        raise McpError(ErrorCode.InternalError, f"AWS S3 API Error: {e.response['Error']['Message']}")
+        logger.error("Error listing buckets: %s", e)
+        raise _to_mcp_error(e)
+
+LIST_PAGE_SIZE = 1000 # Maximum keys returned by one ListObjectsV2 call
+LIST_FANOUT_WIDTH = 16 # Sub-prefixes listed concurrently by _list_contents_fanout
+
+async def _list_contents(bucket_name: str, prefix: str, max_keys: int, start_after: str = '') -> Tuple[List[Dict[str, Any]], bool]:
+    """ Lists up to max_keys objects under prefix (after start_after), one page after another.
+    Also returns whether more objects follow. """
+    extra_args = {'StartAfter': start_after} if start_after else {}
+    page_iterator = list_objects_paginator.paginate(Bucket=bucket_name, Prefix=prefix, PaginationConfig={'MaxItems': max_keys}, **extra_args)
+    contents: List[Dict[str, Any]] = []
+    async for page in page_iterator:
+        contents.extend(page.get('Contents', []))
+    # The paginator sets a resume token when it stopped at MaxItems with more objects left
+    return contents, bool(page_iterator.resume_token)
 
-async def list_objects_handler(args: Dict[str, Any]) -> Dict[str, Any]:
-    """Lists objects in a specific S3 bucket."""
-    bucket_name = args.get('bucket_name')
-    prefix = args.get('prefix', '')
-    max_keys = args.get('max_keys', 1000)
+async def _list_contents_fanout(bucket_name: str, prefix: str, max_keys: int) -> Tuple[List[Dict[str, Any]], bool]:
+    """ Lists up to max_keys objects under prefix by listing its '/'-delimited sub-prefixes concurrently.
+    Also returns whether more objects follow. """
+    response = await s3_client.list_objects_v2(Bucket=bucket_name, Prefix=prefix, Delimiter='/')
+    if response.get('IsTruncated'):
+        # Too many direct children to fan out from a single page
+        return await _list_contents(bucket_name, prefix, max_keys)
 
-    if not bucket_name:
-        raise McpError(ErrorCode.InvalidParams, "Missing required parameter: bucket_name")
+    contents = response.get('Contents', [])
+    sub_prefixes = [p['Prefix'] for p in response.get('CommonPrefixes', [])]
+    listed = 0
+    truncated = False
+    # Sub-prefixes come back in key order, so every key under one sorts before the keys
+    # under the next. Each wave fetches only the first page of its sub-prefixes concurrently;
+    # a sub-prefix with more keys is paged through on its own before the next one is taken,
+    # so at most one page per sub-prefix is fetched beyond max_keys.
+    for i in range(0, len(sub_prefixes), LIST_FANOUT_WIDTH):
+        if listed >= max_keys:
+            truncated = True # Sub-prefixes are never empty, so more keys follow
+            break
+        wave = sub_prefixes[i:i + LIST_FANOUT_WIDTH]
+        page_size = min(LIST_PAGE_SIZE, max_keys - listed)
+        first_pages = await asyncio.gather(*(_list_contents(bucket_name, p, page_size) for p in wave))
+        for sub_prefix, (page, more_in_prefix) in zip(wave, first_pages):
+            if listed >= max_keys:
+                truncated = True
+                break
+            contents.extend(page)
+            listed += len(page)
+            if more_in_prefix:
+                if listed >= max_keys:
+                    truncated = True
+                    break
+                rest, truncated = await _list_contents(bucket_name, sub_prefix, max_keys - listed, page[-1]['Key'])
+                contents.extend(rest)
+                listed += len(rest)
+                if truncated:
+                    break
+        if truncated:
+            break
 
+    contents.sort(key=operator.itemgetter('Key'))
+    return contents[:max_keys], truncated or len(contents) > max_keys
+
+@_bind_args(required=('bucket_name',), optional={'prefix': '', 'max_keys': 1000, 'start_after': ''})
+@_limit_concurrency
+async def list_objects_handler(bucket_name: str, prefix: str, max_keys: int, start_after: str) -> Dict[str, Any]:
+    """Lists objects in a specific S3 bucket, one caller-driven page (of up to max_keys) at a time."""
+    if isinstance(max_keys, bool) or not isinstance(max_keys, int) or max_keys < 1:
+        raise McpError(ErrorCode.InvalidParams, "max_keys must be a positive integer")
     try:
-        paginator = s3_client.get_paginator('list_objects_v2')
-        objects = []
-        page_iterator = paginator.paginate(Bucket=bucket_name, Prefix=prefix, PaginationConfig={'MaxItems': max_keys})
-        for page in page_iterator:
-            for obj in page.get('Contents', []):
-                objects.append({
-                    "key": obj['Key'],
-                    "size": obj['Size'],
-                    "last_modified": obj['LastModified'].isoformat()
-                })
-        return {"objects": objects}
+        # The fan-out can't resume after a key, so continuation pages are listed sequentially
+        if max_keys > LIST_PAGE_SIZE and not start_after:
+            contents, truncated = await _list_contents_fanout(bucket_name, prefix, max_keys)
+        else:
+            contents, truncated = await _list_contents(bucket_name, prefix, max_keys, start_after)
+        # Column-oriented result: three flat lists instead of one dict per object
+        return {
+            "keys": [obj['Key'] for obj in contents],
+            "sizes": [obj['Size'] for obj in contents],
+            "last_modified": [obj['LastModified'].isoformat() for obj in contents],
+            # Pass back as start_after to fetch the next page; None when the listing is complete
+            "next_start_after": contents[-1]['Key'] if truncated and contents else None,
+        }
     except ClientError as e:
-        logger.error(f"Error listing objects in bucket {bucket_name}: {e}")
-        raise McpError(ErrorCode.InternalError, f"AWS S3 API Error: {e.response['Error']['Message']}")
+        logger.error("Error listing objects in bucket %s: %s", bucket_name, e)
+        raise _to_mcp_error(e)
 
-async def get_object_handler(args: Dict[str, Any]) -> Dict[str, Any]:
-    """Gets the content of an object from an S3 bucket."""
-    bucket_name = args.get('bucket_name')
-    key = args.get('key')
+GET_OBJECT_CHUNK_SIZE = 48 * 1024 # A multiple of 3, so full chunks base64-encode without padding
+
+# Recently read objects keyed by (bucket, key) -> (ETag, get_object result). A cached object is
+# revalidated with If-None-Match, so an unchanged object costs one round trip and no body transfer.
+# Bounded by the memory held by cached content (a str takes 1-4 bytes per character) rather than by
+# entry count. The default leaves the 512 MiB task room for in-flight reads and multipart uploads.
+OBJECT_CACHE_MAX_BYTES = int(os.environ.get('S3_OBJECT_CACHE_MAX_BYTES', str(8 * 1024 * 1024)))
+
+def _cached_size(entry: Tuple[str, Dict[str, Any]]) -> int:
+    return sys.getsizeof(entry[1]['content'])
+
+object_cache: LRUCache = LRUCache(maxsize=OBJECT_CACHE_MAX_BYTES, getsizeof=_cached_size)
+
+def _cache_object(bucket_name: str, key: str, etag: Optional[str], result: Dict[str, Any]) -> None:
+    if etag and sys.getsizeof(result['content']) <= OBJECT_CACHE_MAX_BYTES:
+        object_cache[(bucket_name, key)] = (etag, result)
+
+def _evict_objects(bucket_name: str, keys: List[str]) -> None:
+    for key in keys:
+        object_cache.pop((bucket_name, key), None)
+
+async def _base64_encode_chunks(first_chunk: bytes, chunks) -> str:
+    """ Base64-encodes a streamed body piece by piece, so only one chunk is held as bytes at a time """
+    encoded = []
+    pending = first_chunk
+    async for chunk in chunks:
+        pending += chunk
+        # Encode only whole 3-byte groups; short reads carry the remainder into the next chunk
+        aligned = len(pending) - len(pending) % 3
+        encoded.append(base64.b64encode(pending[:aligned]).decode('ascii'))
+        pending = pending[aligned:]
+    encoded.append(base64.b64encode(pending).decode('ascii'))
+    return ''.join(encoded)
+
+async def _read_body(chunks, content_type: str) -> Tuple[str, str]:
+    """ Returns (content, encoding): UTF-8 text as-is, or base64 if a non-text/* body is not valid UTF-8 """
+    # Decode chunk by chunk so the whole body is never held as bytes and str at once
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    parts = []
+    may_be_binary = not content_type.startswith('text/')
+    async for chunk in chunks:
+        try:
+            parts.append(decoder.decode(chunk))
+        except UnicodeDecodeError:
+            if not may_be_binary:
+                raise
+            # Binary content can start with valid UTF-8 (e.g. a tar header), so switch to base64
+            # at any point: re-encode what was decoded, plus the partial character still buffered
+            # by the decoder (a failed decode leaves that buffer untouched), then continue
+            decoded = ''.join(parts).encode('utf-8') + decoder.getstate()[0]
+            parts.clear()
+            return await _base64_encode_chunks(decoded + chunk, chunks), 'base64'
+    try:
+        parts.append(decoder.decode(b'', final=True))
+    except UnicodeDecodeError:
+        if not may_be_binary:
+            raise
+        # The body ended inside a multi-byte sequence
+        decoded = ''.join(parts).encode('utf-8') + decoder.getstate()[0]
+        return base64.b64encode(decoded).decode('ascii'), 'base64'
+    return ''.join(parts), 'utf-8'
 
-    if not bucket_name or not key:
-        raise McpError(ErrorCode.InvalidParams, "Missing required parameters: bucket_name, key")
+@_bind_args(required=('bucket_name', 'key'))
+@_limit_concurrency
+async def get_object_handler(bucket_name: str, key: str) -> Dict[str, Any]:
+    """Gets the content of an object from an S3 bucket."""
+    cached = object_cache.get((bucket_name, key))
+    request = {'Bucket': bucket_name, 'Key': key}
+    if cached:
+        request['IfNoneMatch'] = cached[0]
 
     try:
-        response = s3_client.get_object(Bucket=bucket_name, Key=key)
-        # Read content - handle potential encoding issues if not text
-        # For simplicity, assuming UTF-8 text. Binary data might need base64 encoding.
-        body = response['Body'].read().decode('utf-8')
-        return {"content": body, "content_type": response.get('ContentType', 'unknown')}
+        response = await s3_client.get_object(**request)
+        content_type = response.get('ContentType', 'unknown')
+        async with response['Body'] as stream:
+            body, encoding = await _read_body(stream.iter_chunks(GET_OBJECT_CHUNK_SIZE), content_type)
+        result = {"content": body, "content_type": content_type, "encoding": encoding}
+        _cache_object(bucket_name, key, response.get('ETag'), result)
+        return dict(result)
     except ClientError as e:
+        if cached and e.response['Error']['Code'] == '304': # Not Modified: serve the cached copy
+            return dict(cached[1])
         if e.response['Error']['Code'] == 'NoSuchKey':
-             raise McpError(ErrorCode.NotFound, f"Object not found: s3://{bucket_name}/{key}")
-        logger.error(f"Error getting object s3://{bucket_name}/{key}: {e}")
-        raise McpError(ErrorCode.InternalError, f"AWS S3 API Error: {e.response['Error']['Message']}")
+            _evict_objects(bucket_name, [key])
+            raise McpError(ErrorCode.NotFound, f"Object not found: s3://{bucket_name}/{key}")
+        logger.error("Error getting object s3://%s/%s: %s", bucket_name, key, e)
+        raise _to_mcp_error(e)
     except UnicodeDecodeError:
          raise McpError(ErrorCode.InternalError, "Failed to decode object content as UTF-8. Object might be binary.")
 
 
-async def put_object_handler(args: Dict[str, Any]) -> Dict[str, Any]:
-    """Puts an object into an S3 bucket."""
-    bucket_name = args.get('bucket_name')
-    key = args.get('key')
-    content = args.get('content')
-    content_type = args.get('content_type', 'text/plain') # Default content type
+# Sizes are in characters: a character encodes to at least one UTF-8 byte, so every part
+# but the last is at least MULTIPART_PART_SIZE bytes (S3 requires at least 5 MiB)
+MULTIPART_THRESHOLD = 8 * 1024 * 1024 # Content at least this long is uploaded in parts
+MULTIPART_PART_SIZE = 8 * 1024 * 1024
+MULTIPART_CONCURRENCY = 8 # Parts uploaded at once; bounds the per-upload memory for encoded parts
 
-    if not bucket_name or not key or content is None:
-        raise McpError(ErrorCode.InvalidParams, "Missing required parameters: bucket_name, key, content")
+async def _multipart_upload(bucket_name: str, key: str, content: str, content_type: str) -> Dict[str, Any]:
+    """ Uploads content as a multipart upload, encoding and sending parts concurrently """
+    upload = await s3_client.create_multipart_upload(Bucket=bucket_name, Key=key, ContentType=content_type)
+    upload_id = upload['UploadId']
+    semaphore = asyncio.Semaphore(MULTIPART_CONCURRENCY)
 
+    async def upload_part(part_number: int, start: int) -> Dict[str, Any]:
+        async with semaphore:
+            # Each part is encoded only once a slot is free, so the content is never
+            # held fully encoded; botocore needs a bytes body for its checksum handlers
+            part_body = content[start:start + MULTIPART_PART_SIZE].encode('utf-8')
+            response = await s3_client.upload_part(
+                Bucket=bucket_name,
+                Key=key,
+                UploadId=upload_id,
+                PartNumber=part_number,
+                Body=part_body,
+                ContentLength=len(part_body)
+            )
+            return {"PartNumber": part_number, "ETag": response['ETag']}
+
+    tasks = [
+        asyncio.create_task(upload_part(part_number, start))
+        for part_number, start in enumerate(range(0, len(content), MULTIPART_PART_SIZE), start=1)
+    ]
     try:
-        # Assuming content is string, encode to bytes
-        body_bytes = content.encode('utf-8')
-        response = s3_client.put_object(
+        parts = await asyncio.gather(*tasks)
+        return await s3_client.complete_multipart_upload(
             Bucket=bucket_name,
             Key=key,
-            Body=body_bytes,
-            ContentType=content_type
+            UploadId=upload_id,
+            MultipartUpload={"Parts": list(parts)}
         )
+    except BaseException: # Also abort when the tool call itself is cancelled
+        # Stop the parts still in flight first, so none of them lands after the abort
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        # Don't leave orphaned parts behind (they are billed until aborted)
+        try:
+            await s3_client.abort_multipart_upload(Bucket=bucket_name, Key=key, UploadId=upload_id)
+        except (ClientError, BotoCoreError) as abort_error:
+            logger.error("Error aborting multipart upload %s for s3://%s/%s: %s", upload_id, bucket_name, key, abort_error)
+        raise
+
+@_bind_args(required=('bucket_name', 'key', 'content'), optional={'content_type': 'text/plain'}, allow_empty=('content',))
+@_limit_concurrency
+async def put_object_handler(bucket_name: str, key: str, content: str, content_type: str) -> Dict[str, Any]:
+    """Puts an object into an S3 bucket."""
+    try:
+        if len(content) >= MULTIPART_THRESHOLD:
+            response = await _multipart_upload(bucket_name, key, content, content_type)
+        else:
+            # Assuming content is string, encode to bytes
+            body_bytes = content.encode('utf-8')
+            response = await s3_client.put_object(
+                Bucket=bucket_name,
+                Key=key,
+                Body=body_bytes,
+                ContentLength=len(body_bytes),
+                ContentType=content_type
+            )
+        _evict_objects(bucket_name, [key])
         return {"status": "success", "version_id": response.get('VersionId')}
     except ClientError as e:
-        logger.error(f"Error putting object s3://{bucket_name}/{key}: {e}")
-        raise McpError(ErrorCode.InternalError, f"AWS S3 API Error: {e.response['Error']['Message']}")
+        logger.error("Error putting object s3://%s/%s: %s", bucket_name, key, e)
+        raise _to_mcp_error(e)
+
+DELETE_BATCH_SIZE = 1000 # Maximum keys per DeleteObjects request
 
-async def delete_object_handler(args: Dict[str, Any]) -> Dict[str, Any]:
-    """Deletes an object from an S3 bucket."""
-    bucket_name = args.get('bucket_name')
-    key = args.get('key')
+async def _delete_objects(bucket_name: str, keys: List[str]) -> Dict[str, Any]:
+    """ Deletes keys with one DeleteObjects request per batch of up to 1000 keys """
+    # At most one pool's worth of batches in flight at once
+    semaphore = asyncio.Semaphore(S3_CLIENT_CONFIG.max_pool_connections)
 
-    if not bucket_name or not key:
-        raise McpError(ErrorCode.InvalidParams, "Missing required parameters: bucket_name, key")
+    async def delete_batch(batch: List[str]) -> List[Dict[str, Any]]:
+        async with semaphore:
+            response = await s3_client.delete_objects(
+                Bucket=bucket_name,
+                Delete={'Objects': [{'Key': k} for k in batch], 'Quiet': True} # Quiet: only failures are returned
+            )
+        return response.get('Errors', [])
 
+    _evict_objects(bucket_name, keys)
     try:
-        response = s3_client.delete_object(Bucket=bucket_name, Key=key)
+        batch_errors = await asyncio.gather(*(
+            delete_batch(keys[i:i + DELETE_BATCH_SIZE]) for i in range(0, len(keys), DELETE_BATCH_SIZE)
+        ))
+    except ClientError as e:
+        logger.error("Error deleting %d objects from bucket %s: %s", len(keys), bucket_name, e)
+        raise _to_mcp_error(e)
+
+    errors = [
+        {"key": error.get('Key'), "code": error.get('Code'), "message": error.get('Message')}
+        for batch in batch_errors for error in batch
+    ]
+    return {
+        "status": "success" if not errors else "partial",
+        "deleted_count": len(keys) - len(errors),
+        "errors": errors,
+    }
+
+@_bind_args(required=('bucket_name',), optional={'key': None, 'keys': None})
+@_limit_concurrency
+async def delete_object_handler(bucket_name: str, key: Optional[str], keys: Optional[List[str]]) -> Dict[str, Any]:
+    """Deletes one object, or a list of objects, from an S3 bucket."""
+    if not (key or keys):
+        raise McpError(ErrorCode.InvalidParams, "Missing required parameters: key or keys")
+    if key and keys is not None:
+        raise McpError(ErrorCode.InvalidParams, "Pass either key or keys, not both")
+
+    if keys:
+        if not isinstance(keys, list) or not all(isinstance(k, str) and k for k in keys):
+            raise McpError(ErrorCode.InvalidParams, "keys must be a list of non-empty object keys")
+        return await _delete_objects(bucket_name, keys)
+
+    try:
+        _evict_objects(bucket_name, [key])
+        response = await s3_client.delete_object(Bucket=bucket_name, Key=key)
         # delete_object returns 204 No Content on success, response dict might be minimal
         return {"status": "success", "delete_marker": response.get('DeleteMarker'), "version_id": response.get('VersionId')}
     except ClientError as e:
-        logger.error(f"Error deleting object s3://{bucket_name}/{key}: {e}")
-        raise McpError(ErrorCode.InternalError, f"AWS S3 API Error: {e.response['Error']['Message']}")
+        logger.error("Error deleting object s3://%s/%s: %s", bucket_name, key, e)
+        raise _to_mcp_error(e)
+
+
+# Operations used by the tool handlers; their models are loaded at startup instead of on first use
+S3_OPERATIONS = (
+    'ListBuckets', 'ListObjectsV2', 'GetObject', 'PutObject', 'DeleteObject', 'DeleteObjects',
+    'CreateMultipartUpload', 'UploadPart', 'CompleteMultipartUpload', 'AbortMultipartUpload',
+)
+
+async def _warm_up_client(client: Any) -> None:
+    """ Moves the client's one-time setup out of the first tool calls: loads the operation
+    models, resolves credentials and opens a pooled connection with one ListBuckets call
+    (which also fills buckets_cache) """
+    for operation_name in S3_OPERATIONS:
+        client.meta.service_model.operation_model(operation_name)
+    try:
+        await _list_bucket_names()
+    except (ClientError, BotoCoreError) as e:
+        # Not fatal (e.g. no credentials or network yet): the handlers report these errors per call
+        logger.warning("S3 client warm-up call failed: %s", e)
 
 
 # --- MCP Server Setup ---
@@ -140,7 +457,7 @@ class S3McpServer:
         self.server.onerror = self._handle_error
 
     def _handle_error(self, error: Exception):
-        logger.error(f"MCP Server Error: {error}")
+        logger.error("MCP Server Error: %s", error)
         # Optionally implement more specific error handling or reporting
 
     def _get_tools(self) -> List[Tool]:
@@ -153,20 +470,21 @@ class S3McpServer:
             ),
             Tool(
                 name="list_objects",
-                description="Lists objects within a specified S3 bucket.",
+                description="Lists objects within a specified S3 bucket. Returns parallel 'keys', 'sizes' and 'last_modified' lists (entry i of each describes the same object), plus 'next_start_after' when more objects remain.",
                 input_schema=ToolInputSchema(
                     required=["bucket_name"],
                     properties={
                         "bucket_name": ToolParameter(type="string", description="The name of the S3 bucket."),
                         "prefix": ToolParameter(type="string", description="Optional prefix to filter objects."),
-                        "max_keys": ToolParameter(type="integer", description="Optional maximum number of keys to return (default 1000).")
+                        "max_keys": ToolParameter(type="integer", description="Optional maximum number of keys to return (default 1000)."),
+                        "start_after": ToolParameter(type="string", description="Optional key to continue listing after; pass the 'next_start_after' value from the previous call to get the next page.")
                     }
                 ),
                 handler=list_objects_handler
             ),
              Tool(
                 name="get_object",
-                description="Retrieves the content of an object from an S3 bucket (assumes UTF-8 text).",
+                description="Retrieves the content of an object from an S3 bucket. UTF-8 text is returned as-is; binary content is returned base64-encoded with encoding 'base64'.",
                 input_schema=ToolInputSchema(
                     required=["bucket_name", "key"],
                     properties={
@@ -192,12 +510,17 @@ class S3McpServer:
             ),
              Tool(
                 name="delete_object",
-                description="Deletes an object from an S3 bucket.",
+                description="Deletes an object, or a list of objects, from an S3 bucket. Provide either 'key' or 'keys', not both.",
                 input_schema=ToolInputSchema(
-                    required=["bucket_name", "key"],
+                    required=["bucket_name"],
                     properties={
                         "bucket_name": ToolParameter(type="string", description="The name of the S3 bucket."),
-                        "key": ToolParameter(type="string", description="The key (path) of the object to delete.")
+                        "key": ToolParameter(type="string", description="The key (path) of the object to delete."),
+                        "keys": ToolParameter(
+                            type="array",
+                            description="Optional list of keys to delete in bulk (deleted with DeleteObjects, up to 1000 keys per request).",
+                            items={"type": "string"}
+                        )
                     }
                 ),
                 handler=delete_object_handler
@@ -205,8 +528,19 @@ class S3McpServer:
         ]
 
     async def run(self):
+        global s3_client, s3_semaphore, list_objects_paginator
         logger.info("Starting S3 MCP Server...")
-        await self.server.run()
+        s3_semaphore = asyncio.Semaphore(S3_CLIENT_CONFIG.max_pool_connections)
+        # The client (and its connection pool) is closed when the server stops
+        async with session.create_client('s3', config=S3_CLIENT_CONFIG) as client:
+            s3_client = client
+            list_objects_paginator = client.get_paginator('list_objects_v2')
+            await _warm_up_client(client)
+            try:
+                await self.server.run()
+            finally:
+                s3_client = None
+                list_objects_paginator = None
         logger.info("S3 MCP Server stopped.")
 
 async def main():
@@ -216,4 +550,10 @@ async def main():
     await server_instance.run()
 
 if __name__ == "__main__":
+    # Prefer the libuv-based event loop; fall back to the default asyncio loop where uvloop isn't available (e.g. Windows)
+    try:
+        import uvloop  # type: ignore
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
     asyncio.run(main())
\ No newline at end of file